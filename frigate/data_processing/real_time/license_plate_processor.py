@@ -1,22 +1,32 @@
 """Handle processing images for face detection and recognition."""
 
-import datetime
 import logging
 import math
 import re
+import time
 from typing import List, Optional, Tuple
 
 import cv2
 import numpy as np
 import requests
 from pyclipper import ET_CLOSEDPOLYGON, JT_ROUND, PyclipperOffset
-from shapely.geometry import Polygon
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is an optional accelerator for the CTC decode hot loop
+    njit = None
 
 from frigate.comms.inter_process import InterProcessRequestor
 from frigate.config import FrigateConfig
 from frigate.const import FRIGATE_LOCALHOST
 from frigate.embeddings.functions.onnx import GenericONNXEmbedding, ModelTypeEnum
-from frigate.util.image import area
+from frigate.util.image import (
+    area,
+    calculate_region,
+    yuv_region_2_bgr,
+    yuv_region_2_rgb,
+)
 
 from ..types import DataProcessorMetrics
 from .api import RealTimeProcessorApi
@@ -25,20 +35,53 @@ logger = logging.getLogger(__name__)
 
 MIN_PLATE_LENGTH = 3
 
+# quantized padded widths for recognition batches; plates in the same bucket
+# only pad out to the bucket width instead of the widest plate of the batch
+RECOGNITION_WIDTH_BUCKETS = (160, 240, 320)
+
 
 class LicensePlateProcessor(RealTimeProcessorApi):
     def __init__(self, config: FrigateConfig, metrics: DataProcessorMetrics):
         super().__init__(config, metrics)
         self.requestor = InterProcessRequestor()
+
+        # reuse one HTTP session for sub label updates to keep the
+        # localhost connection alive between plates
+        self.session = requests.Session()
+        self._sub_label_url = f"{FRIGATE_LOCALHOST}/api/events/%s/sub_label"
         self.lpr_config = config.lpr
         self.requires_license_plate_detection = (
             "license_plate" not in self.config.objects.all_objects
         )
         self.detected_license_plates: dict[str, dict[str, any]] = {}
 
-        self.ctc_decoder = CTCDecoder()
+        # precompile each label's known plates into a single anchored
+        # alternation so each detection is one regex match per label; plates
+        # that don't embed cleanly in an alternation fall back to one compiled
+        # pattern per plate, and invalid plates are skipped with a warning
+        # instead of taking down the processor
+        self._known_plate_patterns: dict[str, list[re.Pattern]] = {}
+        for label, plates in self.lpr_config.known_plates.items():
+            try:
+                self._known_plate_patterns[label] = [
+                    re.compile(
+                        "^(?:" + "|".join(f"(?:{plate})" for plate in plates) + ")$"
+                    )
+                ]
+            except re.error:
+                patterns = []
+
+                for plate in plates:
+                    try:
+                        patterns.append(re.compile(f"^{plate}$"))
+                    except re.error:
+                        logger.warning(
+                            f"Ignoring invalid known plate pattern for {label}: {plate}"
+                        )
 
-        self.batch_size = 6
+                self._known_plate_patterns[label] = patterns
+
+        self.ctc_decoder = CTCDecoder()
 
         # Detection specific parameters
         self.min_size = 3
@@ -46,6 +89,18 @@ class LicensePlateProcessor(RealTimeProcessorApi):
         self.box_thresh = 0.8
         self.mask_thresh = 0.8
 
+        # normalization constants for the detection model, kept as float32
+        # so the image is never upcast to float64
+        self._norm_mean = np.array([123.675, 116.28, 103.53], dtype=np.float32)
+        self._norm_scale = 1.0 / np.array([58.395, 57.12, 57.375], dtype=np.float32)
+
+        # uint8 -> normalized float32 lookup table shared by the
+        # classification and recognition preprocessing
+        self._u8_to_norm = ((np.arange(256, dtype=np.float32) / 255.0) - 0.5) / 0.5
+
+        # reusable polygon offsetter, cleared between contours
+        self._poly_offset = PyclipperOffset()
+
         self.lpr_detection_model = None
         self.lpr_classification_model = None
         self.lpr_recognition_model = None
@@ -93,6 +148,14 @@ class LicensePlateProcessor(RealTimeProcessorApi):
             self.classification_model._load_model_and_utils()
             self.recognition_model._load_model_and_utils()
 
+            # cache the recognition model's input width, None when dynamic
+            model_input_w = self.recognition_model.runner.ort.get_inputs()[0].shape[3]
+            self._rec_model_input_w = (
+                model_input_w
+                if isinstance(model_input_w, int) and model_input_w > 0
+                else None
+            )
+
     def _detect(self, image: np.ndarray) -> List[np.ndarray]:
         """
         Detect possible license plates in the input image by first resizing and normalizing it,
@@ -131,15 +194,27 @@ class LicensePlateProcessor(RealTimeProcessorApi):
             Tuple[List[np.ndarray], List[Tuple[str, float]]]: A tuple of rotated/normalized plate images
                                                             and classification results with confidence scores.
         """
-        num_images = len(images)
+        if len(images) == 1:
+            # common single plate case: skip the sorting and batching machinery
+            norm_images = np.zeros((1, 3, 48, 192), dtype=np.float32)
+            self._preprocess_classification_image(images[0], norm_images[0])
+            scores = self.classification_model(norm_images)[0]
+
+            idx = int(scores.argmax())
+            label, score = ["0", "180"][idx], scores[idx]
+
+            if "180" in label and score >= self.lpr_config.threshold:
+                images[0] = cv2.rotate(images[0], cv2.ROTATE_180)
+
+            return images, [[label, score]]
+
         indices = np.argsort([x.shape[1] / x.shape[0] for x in images])
 
-        for i in range(0, num_images, self.batch_size):
-            norm_images = []
-            for j in range(i, min(num_images, i + self.batch_size)):
-                norm_img = self._preprocess_classification_image(images[indices[j]])
-                norm_img = norm_img[np.newaxis, :]
-                norm_images.append(norm_img)
+        # preprocess images in aspect ratio order directly into one batch
+        # tensor, with a fixed height of 48 and width padded to 192
+        norm_images = np.zeros((len(indices), 3, 48, 192), dtype=np.float32)
+        for i, index in enumerate(indices):
+            self._preprocess_classification_image(images[index], norm_images[i])
 
         outputs = self.classification_model(norm_images)
 
@@ -147,46 +222,66 @@ class LicensePlateProcessor(RealTimeProcessorApi):
 
     def _recognize(
         self, images: List[np.ndarray]
-    ) -> Tuple[List[str], List[List[float]]]:
+    ) -> Tuple[List[str], List[np.ndarray], List[float]]:
         """
         Recognize the characters on the detected license plates using the recognition model.
 
         Args:
-            images (List[np.ndarray]): A list of images of license plates to recognize.
+            images (List[np.ndarray]): A list of images of license plates to recognize,
+                                       already sorted by aspect ratio.
 
         Returns:
-            Tuple[List[str], List[List[float]]]: A tuple of recognized license plate texts and confidence scores.
+            Tuple[List[str], List[np.ndarray], List[float]]: A tuple of recognized license
+            plate texts, per-character confidence scores, and average confidences.
         """
-        input_shape = [3, 48, 320]
-        num_images = len(images)
+        input_h = 48
 
-        # sort images by aspect ratio for processing
-        indices = np.argsort(np.array([x.shape[1] / x.shape[0] for x in images]))
+        if self._rec_model_input_w is not None:
+            # the model input width is static, so bucketing cannot reduce padding
+            buckets: dict[int, list[int]] = {
+                self._rec_model_input_w: list(range(len(images)))
+            }
+        else:
+            # group images into padded width buckets so narrow plates are not
+            # padded out to the widest plate of the batch
+            buckets = {}
+            overflow: list[int] = []
+            overflow_w = 0
+
+            for index in range(len(images)):
+                h, w = images[index].shape[0:2]
+                needed_w = math.ceil(input_h * (w / h))
+                bucket_w = next(
+                    (b for b in RECOGNITION_WIDTH_BUCKETS if b >= needed_w), None
+                )
 
-        for index in range(0, num_images, self.batch_size):
-            input_h, input_w = input_shape[1], input_shape[2]
-            max_wh_ratio = input_w / input_h
-            norm_images = []
+                if bucket_w is None:
+                    # wider than the largest bucket, pad to the widest such plate
+                    overflow.append(index)
+                    overflow_w = max(overflow_w, needed_w)
+                else:
+                    buckets.setdefault(bucket_w, []).append(index)
 
-            # calculate the maximum aspect ratio in the current batch
-            for i in range(index, min(num_images, index + self.batch_size)):
-                h, w = images[indices[i]].shape[0:2]
-                max_wh_ratio = max(max_wh_ratio, w * 1.0 / h)
+            if overflow:
+                buckets[overflow_w] = overflow
 
-            # preprocess the images based on the max aspect ratio
-            for i in range(index, min(num_images, index + self.batch_size)):
-                norm_image = self._preprocess_recognition_image(
-                    images[indices[i]], max_wh_ratio
-                )
-                norm_image = norm_image[np.newaxis, :]
-                norm_images.append(norm_image)
+        # run one batched inference per bucket; images arrive sorted by aspect
+        # ratio so bucket outputs concatenate back in input order
+        outputs = []
+        for bucket_w, bucket_indices in buckets.items():
+            norm_images = np.zeros(
+                (len(bucket_indices), 3, input_h, bucket_w), dtype=np.float32
+            )
+            for i, index in enumerate(bucket_indices):
+                self._preprocess_recognition_image(images[index], norm_images[i])
+
+            outputs.extend(self.recognition_model(norm_images))
 
-        outputs = self.recognition_model(norm_images)
         return self.ctc_decoder(outputs)
 
     def _process_license_plate(
         self, image: np.ndarray
-    ) -> Tuple[List[str], List[float], List[int]]:
+    ) -> Tuple[List[str], List[np.ndarray], List[float], List[int]]:
         """
         Complete pipeline for detecting, classifying, and recognizing license plates in the input image.
 
@@ -194,7 +289,8 @@ class LicensePlateProcessor(RealTimeProcessorApi):
             image (np.ndarray): The input image in which to detect, classify, and recognize license plates.
 
         Returns:
-            Tuple[List[str], List[float], List[int]]: Detected license plate texts, confidence scores, and areas of the plates.
+            Tuple[List[str], List[np.ndarray], List[float], List[int]]: Detected license plate texts,
+            per-character confidences, average confidences, and areas of the plates.
         """
         if (
             self.detection_model.runner is None
@@ -203,38 +299,39 @@ class LicensePlateProcessor(RealTimeProcessorApi):
         ):
             # we might still be downloading the models
             logger.debug("Model runners not loaded")
-            return [], [], []
+            return [], [], [], []
 
         plate_points = self._detect(image)
         if len(plate_points) == 0:
-            return [], [], []
+            return [], [], [], []
 
         plate_points = self._sort_polygon(list(plate_points))
         plate_images = [self._crop_license_plate(image, x) for x in plate_points]
         rotated_images, _ = self._classify(plate_images)
 
-        # keep track of the index of each image for correct area calc later
+        # sort images by aspect ratio once for recognition; results come back
+        # in sorted order, so sorted_indices maps them to the original images
         sorted_indices = np.argsort([x.shape[1] / x.shape[0] for x in rotated_images])
-        reverse_mapping = {
-            idx: original_idx for original_idx, idx in enumerate(sorted_indices)
-        }
 
-        results, confidences = self._recognize(rotated_images)
+        results, confidences, avg_confidences = self._recognize(
+            [rotated_images[index] for index in sorted_indices]
+        )
 
         if results:
             license_plates = [""] * len(rotated_images)
-            average_confidences = [[0.0]] * len(rotated_images)
+            char_confidences = [np.zeros(0, dtype=np.float32)] * len(rotated_images)
+            average_confidences = [0.0] * len(rotated_images)
             areas = [0] * len(rotated_images)
 
             # map results back to original image order
-            for i, (plate, conf) in enumerate(zip(results, confidences)):
-                original_idx = reverse_mapping[i]
+            for i, (plate, conf, avg_conf) in enumerate(
+                zip(results, confidences, avg_confidences)
+            ):
+                original_idx = sorted_indices[i]
 
                 height, width = rotated_images[original_idx].shape[:2]
                 area = height * width
 
-                average_confidence = conf
-
                 # set to True to write each cropped image for debugging
                 if False:
                     save_image = cv2.cvtColor(
@@ -244,27 +341,28 @@ class LicensePlateProcessor(RealTimeProcessorApi):
                     cv2.imwrite(filename, save_image)
 
                 license_plates[original_idx] = plate
-                average_confidences[original_idx] = average_confidence
+                char_confidences[original_idx] = conf
+                average_confidences[original_idx] = avg_conf
                 areas[original_idx] = area
 
             # Filter out plates that have a length of less than 3 characters
             # Sort by area, then by plate length, then by confidence all desc
             sorted_data = sorted(
                 [
-                    (plate, conf, area)
-                    for plate, conf, area in zip(
-                        license_plates, average_confidences, areas
+                    (plate, conf, avg_conf, area)
+                    for plate, conf, avg_conf, area in zip(
+                        license_plates, char_confidences, average_confidences, areas
                     )
                     if len(plate) >= MIN_PLATE_LENGTH
                 ],
-                key=lambda x: (x[2], len(x[0]), x[1]),
+                key=lambda x: (x[3], len(x[0]), x[2]),
                 reverse=True,
             )
 
             if sorted_data:
                 return map(list, zip(*sorted_data))
 
-        return [], [], []
+        return [], [], [], []
 
     def _resize_image(self, image: np.ndarray) -> np.ndarray:
         """
@@ -292,13 +390,14 @@ class LicensePlateProcessor(RealTimeProcessorApi):
         Returns:
             np.ndarray: The normalized image, transposed to match the model's expected input format.
         """
-        mean = np.array([123.675, 116.28, 103.53]).reshape(1, -1).astype("float64")
-        std = 1 / np.array([58.395, 57.12, 57.375]).reshape(1, -1).astype("float64")
+        h, w = image.shape[:2]
+        normalized = (image.astype(np.float32) - self._norm_mean) * self._norm_scale
 
-        image = image.astype("float32")
-        cv2.subtract(image, mean, image)
-        cv2.multiply(image, std, image)
-        return image.transpose((2, 0, 1))[np.newaxis, ...]
+        # emit NCHW with contiguous per-channel writes instead of a strided transpose
+        chw = np.empty((1, 3, h, w), dtype=np.float32)
+        for channel in range(3):
+            chw[0, channel] = normalized[:, :, channel]
+        return chw
 
     def _boxes_from_bitmap(
         self, output: np.ndarray, mask: np.ndarray, dest_width: int, dest_height: int
@@ -316,8 +415,15 @@ class LicensePlateProcessor(RealTimeProcessorApi):
             Tuple[np.ndarray, List[float]]: Array of bounding boxes and list of corresponding scores.
         """
 
-        mask = (mask * 255).astype(np.uint8)
+        # findContours only distinguishes zero from nonzero, so a plain uint8
+        # cast of the boolean mask is enough
+        mask = mask.astype(np.uint8)
         height, width = mask.shape
+
+        # scale factors from the mask resolution to the destination image
+        scale_w = dest_width / width
+        scale_h = dest_height / height
+
         outs = cv2.findContours(mask, cv2.RETR_LIST, cv2.CHAIN_APPROX_SIMPLE)
 
         # handle different return values of findContours between OpenCV versions
@@ -329,6 +435,13 @@ class LicensePlateProcessor(RealTimeProcessorApi):
         for index in range(len(contours)):
             contour = contours[index]
 
+            # cheap axis-aligned gate: the rotated rectangle can never have a
+            # larger minimum side than the bounding rectangle, so sub-threshold
+            # noise contours skip the minAreaRect math entirely
+            _, _, rect_w, rect_h = cv2.boundingRect(contour)
+            if min(rect_w, rect_h) < self.min_size:
+                continue
+
             # get minimum bounding box (rotated rectangle) around the contour and the smallest side length.
             points, min_side = self._get_min_boxes(contour)
 
@@ -341,13 +454,15 @@ class LicensePlateProcessor(RealTimeProcessorApi):
             if self.box_thresh > score:
                 continue
 
-            polygon = Polygon(points)
-            distance = polygon.area / polygon.length
+            area, perimeter = self._polygon_area_perimeter(points)
+            distance = area / perimeter
 
             # Use pyclipper to shrink the polygon slightly based on the computed distance.
-            offset = PyclipperOffset()
-            offset.AddPath(points, JT_ROUND, ET_CLOSEDPOLYGON)
-            points = np.array(offset.Execute(distance * 1.5)).reshape((-1, 1, 2))
+            self._poly_offset.Clear()
+            self._poly_offset.AddPath(points, JT_ROUND, ET_CLOSEDPOLYGON)
+            points = np.array(self._poly_offset.Execute(distance * 1.5)).reshape(
+                (-1, 1, 2)
+            )
 
             # get the minimum bounding box around the shrunken polygon.
             box, min_side = self._get_min_boxes(points)
@@ -358,10 +473,8 @@ class LicensePlateProcessor(RealTimeProcessorApi):
             box = np.array(box)
 
             # normalize and clip box coordinates to fit within the destination image size.
-            box[:, 0] = np.clip(np.round(box[:, 0] / width * dest_width), 0, dest_width)
-            box[:, 1] = np.clip(
-                np.round(box[:, 1] / height * dest_height), 0, dest_height
-            )
+            box[:, 0] = np.clip(np.round(box[:, 0] * scale_w), 0, dest_width)
+            box[:, 1] = np.clip(np.round(box[:, 1] * scale_h), 0, dest_height)
 
             boxes.append(box.astype("int32"))
             scores.append(score)
@@ -408,7 +521,27 @@ class LicensePlateProcessor(RealTimeProcessorApi):
         return cv2.mean(bitmap[y1 : y2 + 1, x1 : x2 + 1], mask)[0]
 
     @staticmethod
-    def _expand_box(points: List[Tuple[float, float]]) -> np.ndarray:
+    def _polygon_area_perimeter(points: np.ndarray) -> Tuple[float, float]:
+        """
+        Compute the area and perimeter of a polygon in closed form.
+
+        Args:
+            points (np.ndarray): Points of the polygon.
+
+        Returns:
+            Tuple[float, float]: The polygon's area and perimeter.
+        """
+        pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        rolled = np.roll(pts, -1, axis=0)
+
+        # shoelace formula for the area, summed edge lengths for the perimeter
+        area = 0.5 * abs(
+            np.dot(pts[:, 0], rolled[:, 1]) - np.dot(pts[:, 1], rolled[:, 0])
+        )
+        perimeter = np.linalg.norm(rolled - pts, axis=1).sum()
+        return area, perimeter
+
+    def _expand_box(self, points: List[Tuple[float, float]]) -> np.ndarray:
         """
         Expand a polygonal shape slightly by a factor determined by the area-to-perimeter ratio.
 
@@ -418,11 +551,11 @@ class LicensePlateProcessor(RealTimeProcessorApi):
         Returns:
             np.ndarray: Expanded polygon points.
         """
-        polygon = Polygon(points)
-        distance = polygon.area / polygon.length
-        offset = PyclipperOffset()
-        offset.AddPath(points, JT_ROUND, ET_CLOSEDPOLYGON)
-        expanded = np.array(offset.Execute(distance * 1.5)).reshape((-1, 2))
+        area, perimeter = self._polygon_area_perimeter(points)
+        distance = area / perimeter
+        self._poly_offset.Clear()
+        self._poly_offset.AddPath(points, JT_ROUND, ET_CLOSEDPOLYGON)
+        expanded = np.array(self._poly_offset.Execute(distance * 1.5)).reshape((-1, 2))
         return expanded
 
     def _filter_polygon(
@@ -440,54 +573,48 @@ class LicensePlateProcessor(RealTimeProcessorApi):
             np.ndarray: List of filtered polygons.
         """
         height, width = shape
-        return np.array(
-            [
-                self._clockwise_order(point)
-                for point in points
-                if self._is_valid_polygon(point, width, height)
-            ]
+        points = np.asarray(points)
+
+        if points.size == 0:
+            return points
+
+        points = points[self._is_valid_polygon(points, width, height)]
+
+        if points.size == 0:
+            return points
+
+        # arrange each polygon's points in clockwise order based on their
+        # angular positions around the polygon's center, all in one pass
+        centers = points.mean(axis=1, keepdims=True)
+        angles = np.arctan2(
+            points[:, :, 1] - centers[:, :, 1], points[:, :, 0] - centers[:, :, 0]
         )
+        order = np.argsort(angles, axis=1)
+        return np.take_along_axis(points, order[:, :, np.newaxis], axis=1)
 
     @staticmethod
-    def _is_valid_polygon(point: np.ndarray, width: int, height: int) -> bool:
+    def _is_valid_polygon(points: np.ndarray, width: int, height: int) -> np.ndarray:
         """
-        Check if a polygon is valid, meaning it fits within the image bounds
-        and has sides of a minimum length.
+        Check which polygons are valid, meaning they fit within the image bounds
+        and have sides of a minimum length.
 
         Args:
-            point (np.ndarray): The polygon to validate.
+            points (np.ndarray): The (N, 4, 2) polygons to validate.
             width (int): Image width.
             height (int): Image height.
 
         Returns:
-            bool: Whether the polygon is valid or not.
+            np.ndarray: Boolean mask of the valid polygons.
         """
         return (
-            point[:, 0].min() >= 0
-            and point[:, 0].max() < width
-            and point[:, 1].min() >= 0
-            and point[:, 1].max() < height
-            and np.linalg.norm(point[0] - point[1]) > 3
-            and np.linalg.norm(point[0] - point[3]) > 3
+            (points[:, :, 0].min(axis=1) >= 0)
+            & (points[:, :, 0].max(axis=1) < width)
+            & (points[:, :, 1].min(axis=1) >= 0)
+            & (points[:, :, 1].max(axis=1) < height)
+            & (np.linalg.norm(points[:, 0] - points[:, 1], axis=1) > 3)
+            & (np.linalg.norm(points[:, 0] - points[:, 3], axis=1) > 3)
         )
 
-    @staticmethod
-    def _clockwise_order(point: np.ndarray) -> np.ndarray:
-        """
-        Arrange the points of a polygon in clockwise order based on their angular positions
-        around the polygon's center.
-
-        Args:
-            point (np.ndarray): Array of points of the polygon.
-
-        Returns:
-            np.ndarray: Points ordered in clockwise direction.
-        """
-        center = point.mean(axis=0)
-        return point[
-            np.argsort(np.arctan2(point[:, 1] - center[1], point[:, 0] - center[0]))
-        ]
-
     @staticmethod
     def _sort_polygon(points):
         """
@@ -500,17 +627,9 @@ class LicensePlateProcessor(RealTimeProcessorApi):
         Returns:
             List: Sorted list of polygons.
         """
-        points.sort(key=lambda x: (x[0][1], x[0][0]))
-        for i in range(len(points) - 1):
-            for j in range(i, -1, -1):
-                if abs(points[j + 1][0][1] - points[j][0][1]) < 10 and (
-                    points[j + 1][0][0] < points[j][0][0]
-                ):
-                    temp = points[j]
-                    points[j] = points[j + 1]
-                    points[j + 1] = temp
-                else:
-                    break
+        # quantize y into 10 pixel rows so plates on the same row sort by x,
+        # giving reading order in a single sort pass
+        points.sort(key=lambda x: (x[0][1] // 10, x[0][0]))
         return points
 
     @staticmethod
@@ -530,24 +649,20 @@ class LicensePlateProcessor(RealTimeProcessorApi):
         pad[:h, :w, :] = image
         return pad
 
-    @staticmethod
-    def _preprocess_classification_image(image: np.ndarray) -> np.ndarray:
+    def _preprocess_classification_image(self, image: np.ndarray, out: np.ndarray) -> None:
         """
-        Preprocess a single image for classification by resizing, normalizing, and padding.
+        Preprocess a single image for classification by resizing and normalizing.
 
-        This method resizes the input image to a fixed height of 48 pixels while adjusting
-        the width dynamically up to a maximum of 192 pixels. The image is then normalized and
-        padded to fit the required input dimensions for classification.
+        This method resizes the input image to the fixed height of the zeroed output
+        slice while adjusting the width dynamically up to the slice's width. The image
+        is then normalized and written into the output slice, so the remaining width
+        stays zero padded.
 
         Args:
             image (np.ndarray): Input image to preprocess.
-
-        Returns:
-            np.ndarray: Preprocessed and padded image.
+            out (np.ndarray): Zeroed (C, H, W) slice of the batch tensor to fill.
         """
-        # fixed height of 48, dynamic width up to 192
-        input_shape = (3, 48, 192)
-        input_c, input_h, input_w = input_shape
+        input_c, input_h, input_w = out.shape
 
         h, w = image.shape[:2]
         ratio = w / h
@@ -555,19 +670,16 @@ class LicensePlateProcessor(RealTimeProcessorApi):
 
         resized_image = cv2.resize(image, (resized_w, input_h))
 
+        # normalize uint8 input through a single table lookup
+        resized_image = self._u8_to_norm[resized_image]
+
         # handle single-channel images (grayscale) if needed
         if input_c == 1 and resized_image.ndim == 2:
             resized_image = resized_image[np.newaxis, :, :]
         else:
             resized_image = resized_image.transpose((2, 0, 1))
 
-        # normalize
-        resized_image = (resized_image.astype("float32") / 255.0 - 0.5) / 0.5
-
-        padded_image = np.zeros((input_c, input_h, input_w), dtype=np.float32)
-        padded_image[:, :, :resized_w] = resized_image
-
-        return padded_image
+        out[:, :, :resized_w] = resized_image
 
     def _process_classification_output(
         self, images: List[np.ndarray], outputs: List[np.ndarray]
@@ -598,58 +710,39 @@ class LicensePlateProcessor(RealTimeProcessorApi):
             for i, idx in enumerate(outputs.argmax(axis=1))
         ]
 
-        for i in range(0, len(images), self.batch_size):
-            for j in range(len(outputs)):
-                label, score = outputs[j]
-                results[indices[i + j]] = [label, score]
-                if "180" in label and score >= self.lpr_config.threshold:
-                    images[indices[i + j]] = cv2.rotate(images[indices[i + j]], 1)
+        for i, (label, score) in enumerate(outputs):
+            results[indices[i]] = [label, score]
+            if "180" in label and score >= self.lpr_config.threshold:
+                images[indices[i]] = cv2.rotate(images[indices[i]], cv2.ROTATE_180)
 
         return images, results
 
-    def _preprocess_recognition_image(
-        self, image: np.ndarray, max_wh_ratio: float
-    ) -> np.ndarray:
+    def _preprocess_recognition_image(self, image: np.ndarray, out: np.ndarray) -> None:
         """
-        Preprocess an image for recognition by dynamically adjusting its width.
+        Preprocess an image for recognition into a padded batch slice.
 
-        This method adjusts the width of the image based on the maximum width-to-height ratio
-        while keeping the height fixed at 48 pixels. The image is then normalized and padded
-        to fit the required input dimensions for recognition.
+        This method resizes the image to the fixed height of the zeroed output slice,
+        adjusting the width dynamically up to the slice's bucket width. The image is
+        then normalized and written into the output slice, so the remaining width
+        stays zero padded.
 
         Args:
             image (np.ndarray): Input image to preprocess.
-            max_wh_ratio (float): Maximum width-to-height ratio for resizing.
-
-        Returns:
-            np.ndarray: Preprocessed and padded image.
+            out (np.ndarray): Zeroed (C, H, W) slice of the batch tensor to fill.
         """
-        # fixed height of 48, dynamic width based on ratio
-        input_shape = [3, 48, 320]
-        input_h, input_w = input_shape[1], input_shape[2]
-
-        assert image.shape[2] == input_shape[0], "Unexpected number of image channels."
+        input_c, input_h, input_w = out.shape
 
-        # dynamically adjust input width based on max_wh_ratio
-        input_w = int(input_h * max_wh_ratio)
-
-        # check for model-specific input width
-        model_input_w = self.recognition_model.runner.ort.get_inputs()[0].shape[3]
-        if isinstance(model_input_w, int) and model_input_w > 0:
-            input_w = model_input_w
+        assert image.shape[2] == input_c, "Unexpected number of image channels."
 
         h, w = image.shape[:2]
         aspect_ratio = w / h
         resized_w = min(input_w, math.ceil(input_h * aspect_ratio))
 
         resized_image = cv2.resize(image, (resized_w, input_h))
-        resized_image = resized_image.transpose((2, 0, 1))
-        resized_image = (resized_image.astype("float32") / 255.0 - 0.5) / 0.5
-
-        padded_image = np.zeros((input_shape[0], input_h, input_w), dtype=np.float32)
-        padded_image[:, :, :resized_w] = resized_image
 
-        return padded_image
+        # normalize uint8 input through a single table lookup
+        resized_image = self._u8_to_norm[resized_image]
+        out[:, :, :resized_w] = resized_image.transpose((2, 0, 1))
 
     @staticmethod
     def _crop_license_plate(image: np.ndarray, points: np.ndarray) -> np.ndarray:
@@ -669,16 +762,19 @@ class LicensePlateProcessor(RealTimeProcessorApi):
         """
         assert len(points) == 4, "shape of points must be 4*2"
         points = points.astype(np.float32)
+
+        # math.hypot avoids the numpy dispatch overhead of np.linalg.norm
+        # on these 2-element vectors
         crop_width = int(
             max(
-                np.linalg.norm(points[0] - points[1]),
-                np.linalg.norm(points[2] - points[3]),
+                math.hypot(points[0][0] - points[1][0], points[0][1] - points[1][1]),
+                math.hypot(points[2][0] - points[3][0], points[2][1] - points[3][1]),
             )
         )
         crop_height = int(
             max(
-                np.linalg.norm(points[0] - points[3]),
-                np.linalg.norm(points[1] - points[2]),
+                math.hypot(points[0][0] - points[3][0], points[0][1] - points[3][1]),
+                math.hypot(points[1][0] - points[2][0], points[1][1] - points[2][1]),
             )
         )
         pts_std = np.float32(
@@ -694,7 +790,8 @@ class LicensePlateProcessor(RealTimeProcessorApi):
         )
         height, width = image.shape[0:2]
         if height * 1.0 / width >= 1.5:
-            image = np.rot90(image, k=3)
+            # cv2.rotate writes a contiguous buffer, np.rot90 only returns a view
+            image = cv2.rotate(image, cv2.ROTATE_90_CLOCKWISE)
         return image
 
     def __update_metrics(self, duration: float) -> None:
@@ -708,7 +805,7 @@ class LicensePlateProcessor(RealTimeProcessorApi):
 
     def process_frame(self, obj_data: dict[str, any], frame: np.ndarray):
         """Look for license plates in image."""
-        start = datetime.datetime.now().timestamp()
+        start = time.monotonic()
 
         id = obj_data["id"]
 
@@ -739,9 +836,26 @@ class LicensePlateProcessor(RealTimeProcessorApi):
             if not car_box:
                 return
 
-            rgb = cv2.cvtColor(frame, cv2.COLOR_YUV2RGB_I420)
             left, top, right, bottom = car_box
-            car = rgb[top:bottom, left:right]
+
+            # convert and crop only a region covering the car box
+            # instead of the full camera frame
+            frame_height = frame.shape[0] // 3 * 2
+            size = max(right - left, bottom - top)
+            region = calculate_region(
+                (frame_height, frame.shape[1]),
+                left,
+                top,
+                right,
+                bottom,
+                math.ceil(size / 4) * 4,
+                multiplier=1.0,
+            )
+            rgb = yuv_region_2_rgb(frame, region)
+            car = rgb[
+                top - region[1] : bottom - region[1],
+                left - region[0] : right - region[0],
+            ]
             license_plate = self._detect_license_plate(car)
 
             if not license_plate:
@@ -782,15 +896,30 @@ class LicensePlateProcessor(RealTimeProcessorApi):
                 logger.debug(f"Invalid license plate box {license_plate}")
                 return
 
-            license_plate_frame = cv2.cvtColor(frame, cv2.COLOR_YUV2BGR_I420)
+            left, top, right, bottom = license_plate_box
+
+            # convert and crop only a region covering the plate box
+            # instead of the full camera frame
+            frame_height = frame.shape[0] // 3 * 2
+            size = max(right - left, bottom - top)
+            region = calculate_region(
+                (frame_height, frame.shape[1]),
+                left,
+                top,
+                right,
+                bottom,
+                math.ceil(size / 4) * 4,
+                multiplier=1.0,
+            )
+            license_plate_frame = yuv_region_2_bgr(frame, region)
             license_plate_frame = license_plate_frame[
-                license_plate_box[1] : license_plate_box[3],
-                license_plate_box[0] : license_plate_box[2],
+                top - region[1] : bottom - region[1],
+                left - region[0] : right - region[0],
             ]
 
         # run detection, returns results sorted by confidence, best first
-        license_plates, confidences, areas = self._process_license_plate(
-            license_plate_frame
+        license_plates, confidences, avg_confidences, areas = (
+            self._process_license_plate(license_plate_frame)
         )
 
         logger.debug(f"Text boxes: {license_plates}")
@@ -798,11 +927,9 @@ class LicensePlateProcessor(RealTimeProcessorApi):
         logger.debug(f"Areas: {areas}")
 
         if license_plates:
-            for plate, confidence, text_area in zip(license_plates, confidences, areas):
-                avg_confidence = (
-                    (sum(confidence) / len(confidence)) if confidence else 0
-                )
-
+            for plate, avg_confidence, text_area in zip(
+                license_plates, avg_confidences, areas
+            ):
                 logger.debug(
                     f"Detected text: {plate} (average confidence: {avg_confidence:.2f}, area: {text_area} pixels)"
                 )
@@ -816,46 +943,42 @@ class LicensePlateProcessor(RealTimeProcessorApi):
             confidences[0],
             areas[0],
         )
-        avg_confidence = (
-            (sum(top_char_confidences) / len(top_char_confidences))
-            if top_char_confidences
-            else 0
-        )
+        avg_confidence = avg_confidences[0]
 
         # Check if we have a previously detected plate for this ID
         if id in self.detected_license_plates:
-            prev_plate = self.detected_license_plates[id]["plate"]
-            prev_char_confidences = self.detected_license_plates[id]["char_confidences"]
-            prev_area = self.detected_license_plates[id]["area"]
-            prev_avg_confidence = (
-                (sum(prev_char_confidences) / len(prev_char_confidences))
-                if prev_char_confidences
-                else 0
-            )
-
-            # Define conditions for keeping the previous plate
+            previous = self.detected_license_plates[id]
+            prev_plate = previous["plate"]
+            prev_char_confidences = previous["char_confidences"]
+            prev_area = previous["area"]
+            prev_avg_confidence = previous["avg_confidence"]
+
+            # Define conditions for keeping the previous plate, checking the
+            # cheap length/area/average predicates before paying for the
+            # per-character confidence comparison
             shorter_than_previous = len(top_plate) < len(prev_plate)
-            lower_avg_confidence = avg_confidence <= prev_avg_confidence
             smaller_area = top_area < prev_area
 
-            # Compare character-by-character confidence where possible
-            min_length = min(len(top_plate), len(prev_plate))
-            char_confidence_comparison = sum(
-                1
-                for i in range(min_length)
-                if top_char_confidences[i] <= prev_char_confidences[i]
-            )
-            worse_char_confidences = char_confidence_comparison >= min_length / 2
-
             if (shorter_than_previous or smaller_area) and (
-                lower_avg_confidence and worse_char_confidences
+                avg_confidence <= prev_avg_confidence
             ):
-                logger.debug(
-                    f"Keeping previous plate. New plate stats: "
-                    f"length={len(top_plate)}, avg_conf={avg_confidence:.2f}, area={top_area} "
-                    f"vs Previous: length={len(prev_plate)}, avg_conf={prev_avg_confidence:.2f}, area={prev_area}"
+                # Compare character-by-character confidence where possible
+                min_length = min(len(top_plate), len(prev_plate))
+                char_confidence_comparison = int(
+                    np.count_nonzero(
+                        top_char_confidences[:min_length]
+                        <= prev_char_confidences[:min_length]
+                    )
                 )
-                return True
+                worse_char_confidences = char_confidence_comparison >= min_length / 2
+
+                if worse_char_confidences:
+                    logger.debug(
+                        f"Keeping previous plate. New plate stats: "
+                        f"length={len(top_plate)}, avg_conf={avg_confidence:.2f}, area={top_area} "
+                        f"vs Previous: length={len(prev_plate)}, avg_conf={prev_avg_confidence:.2f}, area={prev_area}"
+                    )
+                    return True
 
         # Check against minimum confidence threshold
         if avg_confidence < self.lpr_config.threshold:
@@ -869,15 +992,15 @@ class LicensePlateProcessor(RealTimeProcessorApi):
         sub_label = next(
             (
                 label
-                for label, plates in self.lpr_config.known_plates.items()
-                if any(re.match(f"^{plate}$", top_plate) for plate in plates)
+                for label, patterns in self._known_plate_patterns.items()
+                if any(pattern.match(top_plate) for pattern in patterns)
             ),
             top_plate,
         )
 
         # Send the result to the API
-        resp = requests.post(
-            f"{FRIGATE_LOCALHOST}/api/events/{id}/sub_label",
+        resp = self.session.post(
+            self._sub_label_url % id,
             json={
                 "camera": obj_data.get("camera"),
                 "subLabel": sub_label,
@@ -886,13 +1009,15 @@ class LicensePlateProcessor(RealTimeProcessorApi):
         )
 
         if resp.status_code == 200:
-            self.detected_license_plates[id] = {
-                "plate": top_plate,
-                "char_confidences": top_char_confidences,
-                "area": top_area,
-            }
+            # update the tracked record in place to avoid re-allocating the
+            # dict every time a busy plate improves
+            record = self.detected_license_plates.setdefault(id, {})
+            record["plate"] = top_plate
+            record["char_confidences"] = top_char_confidences
+            record["area"] = top_area
+            record["avg_confidence"] = avg_confidence
 
-        self.__update_metrics(datetime.datetime.now().timestamp() - start)
+        self.__update_metrics(time.monotonic() - start)
 
     def handle_request(self, topic, request_data) -> dict[str, any] | None:
         return
@@ -902,6 +1027,39 @@ class LicensePlateProcessor(RealTimeProcessorApi):
             self.detected_license_plates.pop(object_id)
 
 
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def _ctc_greedy_collapse(seq_probs):
+        """Collapse a (T, V) probability matrix into merged ids and probabilities."""
+        timesteps, num_classes = seq_probs.shape
+        merged_ids = np.empty(timesteps, dtype=np.int32)
+        merged_probs = np.empty(timesteps, dtype=seq_probs.dtype)
+        count = 0
+        prev = -1
+
+        for t in range(timesteps):
+            best = 0
+            best_val = seq_probs[t, 0]
+
+            for c in range(1, num_classes):
+                val = seq_probs[t, c]
+                if val > best_val:
+                    best_val = val
+                    best = c
+
+            if best != 0 and best != prev:
+                merged_ids[count] = best
+                merged_probs[count] = best_val
+                count += 1
+
+            prev = best
+
+        return merged_ids[:count], merged_probs[:count]
+else:
+    _ctc_greedy_collapse = None
+
+
 class CTCDecoder:
     """
     A decoder for interpreting the output of a CTC (Connectionist Temporal Classification) model.
@@ -1018,43 +1176,58 @@ class CTCDecoder:
             " ",
             " ",
         ]
-        self.char_map = {i: char for i, char in enumerate(self.characters)}
+        # numpy array form of the character set for vectorized id -> char lookup
+        self._chars = np.asarray(self.characters)
 
     def __call__(
         self, outputs: List[np.ndarray]
-    ) -> Tuple[List[str], List[List[float]]]:
+    ) -> Tuple[List[str], List[np.ndarray], List[float]]:
         """
         Decode a batch of model outputs into character sequences and their confidence scores.
 
         The method takes the output probability distributions for each time step and uses
         the best path decoding strategy. It then merges repeating characters and ignores
-        blank tokens. Confidence scores for each decoded character are also calculated.
+        blank tokens. Confidence scores for each decoded character are also calculated,
+        along with the average confidence of each sequence.
 
         Args:
             outputs (List[np.ndarray]): A list of model outputs, where each element is
                                         a probability distribution for each time step.
 
         Returns:
-            Tuple[List[str], List[List[float]]]: A tuple of decoded character sequences
-                                                and confidence scores for each sequence.
+            Tuple[List[str], List[np.ndarray], List[float]]: A tuple of decoded character
+                sequences, per-character confidence scores, and average confidences.
         """
         results = []
         confidences = []
+        avg_confidences = []
         for output in outputs:
-            seq_log_probs = np.log(output + 1e-8)
-            best_path = np.argmax(seq_log_probs, axis=1)
-
-            merged_path = []
-            merged_probs = []
-            for t, char_index in enumerate(best_path):
-                if char_index != 0 and (t == 0 or char_index != best_path[t - 1]):
-                    merged_path.append(char_index)
-                    merged_probs.append(seq_log_probs[t, char_index])
-
-            result = "".join(self.char_map[idx] for idx in merged_path)
+            # argmax is unaffected by the log, so collapse the raw probabilities
+            # and skip the full T x V log pass entirely
+            if _ctc_greedy_collapse is not None:
+                merged_path, merged_probs = _ctc_greedy_collapse(output)
+            else:
+                best_path = np.argmax(output, axis=1)
+
+                # keep timesteps that start a new character run and aren't blank,
+                # writing the comparison into the mask to avoid a temporary
+                change = np.empty(len(best_path), dtype=bool)
+                change[0] = True
+                np.not_equal(best_path[1:], best_path[:-1], out=change[1:])
+                keep = change & (best_path != 0)
+
+                merged_path = best_path[keep]
+                merged_probs = output[np.arange(len(best_path)), best_path][keep]
+
+            result = "".join(self._chars[merged_path].tolist())
             results.append(result)
 
-            confidence = np.exp(merged_probs).tolist()
-            confidences.append(confidence)
+            # exp(log(p)) is just p, the kept probabilities are the confidences;
+            # keep them as a float32 array so callers can compare them vectorized
+            merged_probs = np.asarray(merged_probs, dtype=np.float32)
+            confidences.append(merged_probs)
+            avg_confidences.append(
+                float(merged_probs.mean()) if len(merged_probs) else 0.0
+            )
 
-        return results, confidences
+        return results, confidences, avg_confidences
@@ -3,6 +3,10 @@ import sqlite3
 from playhouse.sqliteq import SqliteQueueDatabase
 
 
+class _ExecuteManyParams(list):
+    """Marker for parameter lists the writer thread should bind via executemany."""
+
+
 class SqliteVecQueueDatabase(SqliteQueueDatabase):
     def __init__(self, *args, load_vec_extension: bool = False, **kwargs) -> None:
         self.load_vec_extension: bool = load_vec_extension
@@ -10,6 +14,24 @@ class SqliteVecQueueDatabase(SqliteQueueDatabase):
         self.sqlite_vec_path = "/usr/local/lib/vec0"
         super().__init__(*args, **kwargs)
 
+        # the writer thread funnels every queued statement through _execute;
+        # wrap it so batched parameter sets bind row by row on one prepared
+        # statement instead of reparsing a per-batch VALUES list
+        execute_one = self._execute
+
+        def execute(sql, params=None, *args, **kwargs):
+            if isinstance(params, _ExecuteManyParams):
+                cursor = self.cursor()
+                cursor.executemany(sql, params)
+                return cursor
+            return execute_one(sql, params, *args, **kwargs)
+
+        self._execute = execute
+
+    def execute_many(self, sql: str, params: list[tuple]) -> None:
+        """Execute a fixed parameterized statement once per row of params."""
+        self.execute_sql(sql, _ExecuteManyParams(params))
+
     def _connect(self, *args, **kwargs) -> sqlite3.Connection:
         conn: sqlite3.Connection = super()._connect(*args, **kwargs)
         if self.load_vec_extension:
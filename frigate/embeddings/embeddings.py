@@ -1,10 +1,11 @@
 """SQLite-vec embeddings database."""
 
 import base64
-import datetime
 import logging
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 
 from numpy import ndarray
 from playhouse.shortcuts import model_to_dict
@@ -140,7 +141,7 @@ class Embeddings:
         @param: thumbnail bytes in jpg format
         @param: upsert If embedding should be upserted into vec DB
         """
-        start = datetime.datetime.now().timestamp()
+        start = time.monotonic()
         # Convert thumbnail bytes to PIL Image
         embedding = self.vision_embedding([thumbnail])[0]
 
@@ -153,7 +154,7 @@ class Embeddings:
                 (event_id, serialize(embedding)),
             )
 
-        duration = datetime.datetime.now().timestamp() - start
+        duration = time.monotonic() - start
         self.metrics.image_embeddings_fps.value = (
             self.metrics.image_embeddings_fps.value * 9 + duration
         ) / 10
@@ -168,26 +169,20 @@ class Embeddings:
         @param: event_thumbs Map of Event IDs in DB to thumbnail bytes in jpg format
         @param: upsert If embedding should be upserted into vec DB
         """
-        start = datetime.datetime.now().timestamp()
+        start = time.monotonic()
         ids = list(event_thumbs.keys())
         embeddings = self.vision_embedding(list(event_thumbs.values()))
 
         if upsert:
-            items = []
-
-            for i in range(len(ids)):
-                items.append(ids[i])
-                items.append(serialize(embeddings[i]))
-
-            self.db.execute_sql(
+            self.db.execute_many(
                 """
                 INSERT OR REPLACE INTO vec_thumbnails(id, thumbnail_embedding)
-                VALUES {}
-                """.format(", ".join(["(?, ?)"] * len(ids))),
-                items,
+                VALUES(?, ?)
+                """,
+                [(ids[i], serialize(embeddings[i])) for i in range(len(ids))],
             )
 
-        duration = datetime.datetime.now().timestamp() - start
+        duration = time.monotonic() - start
         self.metrics.text_embeddings_sps.value = (
             self.metrics.text_embeddings_sps.value * 9 + (duration / len(ids))
         ) / 10
@@ -197,7 +192,7 @@ class Embeddings:
     def embed_description(
         self, event_id: str, description: str, upsert: bool = True
     ) -> ndarray:
-        start = datetime.datetime.now().timestamp()
+        start = time.monotonic()
         embedding = self.text_embedding([description])[0]
 
         if upsert:
@@ -209,7 +204,7 @@ class Embeddings:
                 (event_id, serialize(embedding)),
             )
 
-        duration = datetime.datetime.now().timestamp() - start
+        duration = time.monotonic() - start
         self.metrics.text_embeddings_sps.value = (
             self.metrics.text_embeddings_sps.value * 9 + duration
         ) / 10
@@ -219,30 +214,22 @@ class Embeddings:
     def batch_embed_description(
         self, event_descriptions: dict[str, str], upsert: bool = True
     ) -> ndarray:
-        start = datetime.datetime.now().timestamp()
-        # upsert embeddings one by one to avoid token limit
-        embeddings = []
-
-        for desc in event_descriptions.values():
-            embeddings.append(self.text_embedding([desc])[0])
+        start = time.monotonic()
+        # run the whole batch through the model at once; the tokenizer pads
+        # each description to the longest in the batch
+        embeddings = self.text_embedding(list(event_descriptions.values()))
 
         if upsert:
             ids = list(event_descriptions.keys())
-            items = []
-
-            for i in range(len(ids)):
-                items.append(ids[i])
-                items.append(serialize(embeddings[i]))
-
-            self.db.execute_sql(
+            self.db.execute_many(
                 """
                 INSERT OR REPLACE INTO vec_descriptions(id, description_embedding)
-                VALUES {}
-                """.format(", ".join(["(?, ?)"] * len(ids))),
-                items,
+                VALUES(?, ?)
+                """,
+                [(ids[i], serialize(embeddings[i])) for i in range(len(ids))],
             )
 
-        duration = datetime.datetime.now().timestamp() - start
+        duration = time.monotonic() - start
         self.metrics.text_embeddings_sps.value = (
             self.metrics.text_embeddings_sps.value * 9 + (duration / len(ids))
         ) / 10
@@ -274,7 +261,7 @@ class Embeddings:
         )
 
         batch_size = 32
-        current_page = 1
+        last_start_time = None
 
         totals = {
             "thumbnails": 0,
@@ -287,67 +274,81 @@ class Embeddings:
 
         self.requestor.send_data(UPDATE_EMBEDDINGS_REINDEX_PROGRESS, totals)
 
-        events = (
-            Event.select()
-            .where(
-                (Event.has_clip == True | Event.has_snapshot == True)
-                & Event.thumbnail.is_null(False)
-            )
-            .order_by(Event.start_time.desc())
-            .paginate(current_page, batch_size)
-        )
-
-        while len(events) > 0:
-            event: Event
-            batch_thumbs = {}
-            batch_descs = {}
-            for event in events:
-                batch_thumbs[event.id] = base64.b64decode(event.thumbnail)
-                totals["thumbnails"] += 1
-
-                if description := event.data.get("description", "").strip():
-                    batch_descs[event.id] = description
-                    totals["descriptions"] += 1
-
-                totals["processed_objects"] += 1
-
-            # run batch embedding
-            self.batch_embed_thumbnail(batch_thumbs)
-
-            if batch_descs:
-                self.batch_embed_description(batch_descs)
-
-            # report progress every batch so we don't spam the logs
-            progress = (totals["processed_objects"] / total_events) * 100
-            logger.debug(
-                "Processed %d/%d events (%.2f%% complete) | Thumbnails: %d, Descriptions: %d",
-                totals["processed_objects"],
-                total_events,
-                progress,
-                totals["thumbnails"],
-                totals["descriptions"],
+        def fetch_batch(last_start_time: Optional[float]) -> list[tuple]:
+            # select only the columns reindexing needs as plain tuples instead
+            # of materializing full Event models with their thumbnail blobs,
+            # paging with a keyset cursor; OFFSET pagination rescans every
+            # prior row on each page of a large table
+            where = (
+                Event.has_clip == True | Event.has_snapshot == True
+            ) & Event.thumbnail.is_null(False)
+
+            if last_start_time is not None:
+                where = where & (Event.start_time < last_start_time)
+
+            return list(
+                Event.select(Event.id, Event.thumbnail, Event.data, Event.start_time)
+                .where(where)
+                .order_by(Event.start_time.desc())
+                .limit(batch_size)
+                .tuples()
             )
 
-            # Calculate time remaining
-            elapsed_time = time.time() - st
-            avg_time_per_event = elapsed_time / totals["processed_objects"]
-            remaining_events = total_events - totals["processed_objects"]
-            time_remaining = avg_time_per_event * remaining_events
-            totals["time_remaining"] = int(time_remaining)
-
-            self.requestor.send_data(UPDATE_EMBEDDINGS_REINDEX_PROGRESS, totals)
-
-            # Move to the next page
-            current_page += 1
-            events = (
-                Event.select()
-                .where(
-                    (Event.has_clip == True | Event.has_snapshot == True)
-                    & Event.thumbnail.is_null(False)
+        def decode_batch(rows: list[tuple]) -> dict[str, bytes]:
+            return {event_id: base64.b64decode(thumbnail) for event_id, thumbnail, _, _ in rows}
+
+        events = fetch_batch(last_start_time)
+
+        # decode batches on a worker thread so the next batch's base64 decode
+        # overlaps the current batch's inference
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            decode_future = executor.submit(decode_batch, events)
+
+            while len(events) > 0:
+                batch_thumbs = decode_future.result()
+                batch_descs = {}
+                for event_id, _, data, start_time in events:
+                    totals["thumbnails"] += 1
+
+                    if description := data.get("description", "").strip():
+                        batch_descs[event_id] = description
+                        totals["descriptions"] += 1
+
+                    totals["processed_objects"] += 1
+                    last_start_time = start_time
+
+                # fetch the next page and start decoding it before embedding
+                next_events = fetch_batch(last_start_time)
+                if next_events:
+                    decode_future = executor.submit(decode_batch, next_events)
+
+                # run batch embedding
+                self.batch_embed_thumbnail(batch_thumbs)
+
+                if batch_descs:
+                    self.batch_embed_description(batch_descs)
+
+                # report progress every batch so we don't spam the logs
+                progress = (totals["processed_objects"] / total_events) * 100
+                logger.debug(
+                    "Processed %d/%d events (%.2f%% complete) | Thumbnails: %d, Descriptions: %d",
+                    totals["processed_objects"],
+                    total_events,
+                    progress,
+                    totals["thumbnails"],
+                    totals["descriptions"],
                 )
-                .order_by(Event.start_time.desc())
-                .paginate(current_page, batch_size)
-            )
+
+                # Calculate time remaining
+                elapsed_time = time.time() - st
+                avg_time_per_event = elapsed_time / totals["processed_objects"]
+                remaining_events = total_events - totals["processed_objects"]
+                time_remaining = avg_time_per_event * remaining_events
+                totals["time_remaining"] = int(time_remaining)
+
+                self.requestor.send_data(UPDATE_EMBEDDINGS_REINDEX_PROGRESS, totals)
+
+                events = next_events
 
         logger.info(
             "Embedded %d thumbnails and %d descriptions in %s seconds",
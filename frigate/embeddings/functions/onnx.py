@@ -223,20 +223,21 @@ class GenericONNXEmbedding:
             frame = np.expand_dims(frame, axis=0)
             return [{"input_2": frame}]
         elif self.model_type == ModelTypeEnum.lpr_detect:
-            preprocessed = []
-            for x in raw_inputs:
-                preprocessed.append(x)
-            return [{"x": preprocessed[0]}]
+            return [{"x": raw_inputs[0]}]
         elif self.model_type == ModelTypeEnum.lpr_classify:
-            processed = []
-            for img in raw_inputs:
-                processed.append({"x": img})
-            return processed
+            # pass an already batched tensor through, otherwise stack the
+            # preprocessed images into a single batch tensor
+            if isinstance(raw_inputs, np.ndarray):
+                return [{"x": raw_inputs}]
+
+            return [{"x": np.stack(raw_inputs)}]
         elif self.model_type == ModelTypeEnum.lpr_recognize:
-            processed = []
-            for img in raw_inputs:
-                processed.append({"x": img})
-            return processed
+            # pass an already batched tensor through, otherwise stack the
+            # preprocessed images into a single batch tensor
+            if isinstance(raw_inputs, np.ndarray):
+                return [{"x": raw_inputs}]
+
+            return [{"x": np.stack(raw_inputs)}]
         else:
             raise ValueError(f"Unable to preprocess inputs for {self.model_type}")
 
@@ -264,18 +265,31 @@ class GenericONNXEmbedding:
 
         processed_inputs = self._preprocess_inputs(inputs)
         input_names = self.runner.get_input_names()
-        onnx_inputs = {name: [] for name in input_names}
-        input: dict[str, any]
-        for input in processed_inputs:
-            for key, value in input.items():
-                if key in input_names:
-                    onnx_inputs[key].append(value[0])
-
-        for key in input_names:
-            if onnx_inputs.get(key):
-                onnx_inputs[key] = np.stack(onnx_inputs[key])
-            else:
-                logger.warning(f"Expected input '{key}' not found in onnx_inputs")
+
+        if len(processed_inputs) == 1:
+            # inputs are already batched, pass the tensors through directly
+            onnx_inputs = {
+                key: value
+                for key, value in processed_inputs[0].items()
+                if key in input_names
+            }
+
+            for key in input_names:
+                if key not in onnx_inputs:
+                    logger.warning(f"Expected input '{key}' not found in onnx_inputs")
+        else:
+            onnx_inputs = {name: [] for name in input_names}
+            input: dict[str, any]
+            for input in processed_inputs:
+                for key, value in input.items():
+                    if key in input_names:
+                        onnx_inputs[key].append(value[0])
+
+            for key in input_names:
+                if onnx_inputs.get(key):
+                    onnx_inputs[key] = np.stack(onnx_inputs[key])
+                else:
+                    logger.warning(f"Expected input '{key}' not found in onnx_inputs")
 
         embeddings = self.runner.run(onnx_inputs)[0]
         return [embedding for embedding in embeddings]
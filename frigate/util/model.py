@@ -156,8 +156,19 @@ class ONNXModelRunner:
         # Use ONNXRuntime
         if self.interpreter is None:
             self.type = "ort"
+            sess_options = None
+
+            if device == "CPU":
+                # cap the CPU session's threading so concurrent sessions
+                # don't oversubscribe the host with a thread per core each
+                sess_options = ort.SessionOptions()
+                sess_options.intra_op_num_threads = 2
+                sess_options.inter_op_num_threads = 1
+                sess_options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+
             self.ort = ort.InferenceSession(
                 model_path,
+                sess_options=sess_options,
                 providers=providers,
                 provider_options=options,
             )